@@ -12,6 +12,7 @@
 # the most robust and generic fix seems to be to just ban all unicode usage.
 
 import os.path
+import re
 import subprocess
 import sys
 
@@ -31,6 +32,7 @@ UNICODE_WHITELIST = {
     "á", "é", "’",
     "│", "─", "└", "├", "📋",
 }
+NON_ASCII_RE = re.compile(r"[^\x00-\x7f]")
 
 exit_code = 0
 
@@ -45,14 +47,21 @@ for file_path in bfiles.splitlines():
     if ext in EXCLUDE_EXTENSIONS:
         continue
     # open file
+    with open(file_path, "rb") as f:
+        raw = f.read()
+    if raw.isascii():  # fast path: most files have nothing to check
+        continue
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            for line_no, line in enumerate(f.read().splitlines()):
-                for char in line:
-                    if ord(char)>0x7f and char not in UNICODE_WHITELIST:
-                        print(f"{file_path}:{line_no}. {line=}. hex={hex(ord(char))}. {char=}")
-                        exit_code = 1
+        text = raw.decode("utf-8")
     except UnicodeDecodeError as e:
         raise Exception(f"cannot parse file {file_path=}") from e
+    for line_no, line in enumerate(text.splitlines()):
+        if line.isascii():
+            continue
+        for match in NON_ASCII_RE.finditer(line):
+            char = match.group()
+            if char not in UNICODE_WHITELIST:
+                print(f"{file_path}:{line_no}. {line=}. hex={hex(ord(char))}. {char=}")
+                exit_code = 1
 
 sys.exit(exit_code)
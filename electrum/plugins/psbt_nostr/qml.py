@@ -151,17 +151,20 @@ class QmlCosignerWallet(EventListener, CosignerWallet):
         coro = self.send_direct_messages(messages)
 
         loop = util.get_asyncio_loop()
-        assert util.get_running_loop() != loop, 'must not be called from asyncio thread'
-        self._result = None
         self._future = asyncio.run_coroutine_threadsafe(coro, loop)
+        # don't block the GUI thread while waiting for the relays
+        self._future.add_done_callback(self.on_send_done)
 
+    def on_send_done(self, future: concurrent.futures.Future):
+        # note: called from the asyncio thread, signals are delivered to the GUI thread
         try:
-            self._result = self._future.result()
-            self.plugin.so.sendPsbtSuccess.emit()
+            future.result()
         except concurrent.futures.CancelledError:
-            pass
+            return
         except Exception as e:
             self.plugin.so.sendPsbtFailed.emit(str(e))
+            return
+        self.plugin.so.sendPsbtSuccess.emit()
 
     def save_tx_label(self, tx, label):
         self.wallet.set_label(tx.txid(), label)
@@ -1841,34 +1841,40 @@ class NostrTransport(SwapServerTransport):
 
     async def _get_pairs_loop(self):
         await self.is_connected.wait()
+        expected_d_tag = f"electrum-swapserver-{self.NOSTR_EVENT_VERSION}"
+        expected_r_tag = f"net:{constants.net.NET_NAME}"
         query = {
             "kinds": [self.USER_STATUS_NIP38],
             "limit": 10,
-            "#d": [f"electrum-swapserver-{self.NOSTR_EVENT_VERSION}"],
-            "#r": [f"net:{constants.net.NET_NAME}"],
+            "#d": [expected_d_tag],
+            "#r": [expected_r_tag],
             "since": int(time.time()) - 60 * 60,
         }
         async for event in self.relay_manager.get_events(query, single_event=False, only_stored=False):
+            # do the cheap checks before parsing the content
             try:
-                content = json.loads(event.content)
-                if not isinstance(content, dict):
-                    raise Exception("malformed content, not dict")
-                tags = {k: v for k, v in event.tags}
+                tags = dict(event.tags)
             except Exception as e:
-                self.logger.debug(f"failed to parse event: {e}")
+                self.logger.debug(f"failed to parse event tags: {e}")
                 continue
-            if tags.get('d') != f"electrum-swapserver-{self.NOSTR_EVENT_VERSION}":
+            if tags.get('d') != expected_d_tag:
                 continue
-            if tags.get('r') != f"net:{constants.net.NET_NAME}":
+            if tags.get('r') != expected_r_tag:
                 continue
-            if (event.created_at > int(time.time()) + 60 * 60
-                    or event.created_at < int(time.time()) - 60 * 60):
+            if abs(event.created_at - int(time.time())) > 60 * 60:
                 continue
             # check if this is the most recent event for this pubkey
             pubkey = event.pubkey
             prev_offer = self._offers.get(to_nip19('npub', pubkey))
             if prev_offer and event.created_at <= prev_offer.timestamp:
                 continue
+            try:
+                content = json.loads(event.content)
+                if not isinstance(content, dict):
+                    raise Exception("malformed content, not dict")
+            except Exception as e:
+                self.logger.debug(f"failed to parse event: {e}")
+                continue
             try:
                 pow_nonce = int(content.get('pow_nonce', "0"), 16)  # type: int
             except Exception: